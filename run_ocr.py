@@ -33,16 +33,34 @@ def _list_models(project: str | None, location: str, quota_project: str | None)
     sys.exit(0)
 
 
+async def _process_one(
+    input_pdf: pathlib.Path,
+    output_path: pathlib.Path,
+    markdown_provider: anchorite.providers.MarkdownProvider,
+    anchor_provider: anchorite.providers.AnchorProvider | None,
+    page_batch_size: int | None,
+) -> None:
+    print(f"Processing {input_pdf}...")
+    chunks = anchorite.document.chunks(input_pdf, page_count=page_batch_size)
+    result = await anchorite.process_document(chunks, markdown_provider, anchor_provider, renumber=True)
+
+    # annotate() is O(len(markdown)) even with nothing to insert, so skip it
+    # when alignment produced no spans.
+    output_content = result.annotate() if result.anchor_spans else result.markdown_content
+    output_path.write_text(output_content)
+    print(f"Done! Output saved to {output_path}")
+
+
 async def main() -> None:
     logging.basicConfig(level=logging.DEBUG)
     dotenv.load_dotenv()
-    parser = argparse.ArgumentParser(description="Run Gemini OCR on a PDF.")
+    parser = argparse.ArgumentParser(description="Run Gemini OCR on one or more PDFs.")
     parser.add_argument(
-        "input_pdf",
+        "input_pdfs",
         type=pathlib.Path,
-        nargs="?",
-        default=pathlib.Path("main.pdf"),
-        help="Input PDF file.",
+        nargs="*",
+        default=[pathlib.Path("main.pdf")],
+        help="Input PDF files; multiple files are processed concurrently.",
     )
     parser.add_argument(
         "--project",
@@ -83,13 +101,25 @@ async def main() -> None:
         "--output",
         type=pathlib.Path,
         default=pathlib.Path("output.md"),
-        help="Output markdown file",
+        help="Output markdown file (single input only; multiple inputs write <input>.md)",
     )
     parser.add_argument(
         "--cache-dir",
         type=pathlib.Path,
         help="Directory to cache OCR results",
     )
+    parser.add_argument(
+        "--page-batch-size",
+        type=int,
+        default=os.environ.get("GEMINI_OCR_PAGE_BATCH_SIZE"),
+        help="Pages per chunk sent to each API call (default: whole document)",
+    )
+    parser.add_argument(
+        "--num-jobs",
+        type=int,
+        default=os.environ.get("GEMINI_OCR_NUM_JOBS"),
+        help="Maximum concurrent requests per API across all documents (default: unbounded)",
+    )
     parser.add_argument(
         "--mode",
         choices=["gemini", "documentai"],
@@ -112,9 +142,10 @@ async def main() -> None:
     if args.list_models:
         _list_models(args.project, args.location, args.quota_project)
 
-    if not args.input_pdf.exists():
-        print(f"Error: Input file {args.input_pdf} not found.")
-        sys.exit(1)
+    for input_pdf in args.input_pdfs:
+        if not input_pdf.exists():
+            print(f"Error: Input file {input_pdf} not found.")
+            sys.exit(1)
 
     if not args.project:
         print("Error: --project or GOOGLE_CLOUD_PROJECT env var required.")
@@ -133,6 +164,7 @@ async def main() -> None:
             quota_project_id=args.quota_project,
             prompt=args.gemini_prompt,
             cache_dir=cache_dir,
+            max_concurrency=args.num_jobs,
         )
     else:
         if not args.processor_id:
@@ -143,6 +175,7 @@ async def main() -> None:
             location=args.location,
             processor_id=args.processor_id,
             cache_dir=cache_dir,
+            max_concurrency=args.num_jobs,
         )
 
     anchor_provider: anchorite.providers.AnchorProvider | None = None
@@ -152,18 +185,21 @@ async def main() -> None:
             location=args.location,
             processor_id=args.ocr_processor_id,
             cache_dir=cache_dir,
+            max_concurrency=args.num_jobs,
         )
 
-    print(f"Processing {args.input_pdf}...")
+    # Documents are independent and network-bound, so run them concurrently;
+    # the providers are shared across documents, so --num-jobs bounds total
+    # in-flight requests per API rather than per document.
+    outputs = [p.with_suffix(".md") for p in args.input_pdfs] if len(args.input_pdfs) > 1 else [args.output]
 
     try:
-        chunks = anchorite.document.chunks(args.input_pdf)
-        result = await anchorite.process_document(chunks, markdown_provider, anchor_provider, renumber=True)
-
-        output_content = result.annotate() if anchor_provider else result.markdown_content
-        args.output.write_text(output_content)
-        print(f"Done! Output saved to {args.output}")
-
+        await asyncio.gather(
+            *(
+                _process_one(input_pdf, output_path, markdown_provider, anchor_provider, args.page_batch_size)
+                for input_pdf, output_path in zip(args.input_pdfs, outputs, strict=True)
+            ),
+        )
     except Exception as e:  # noqa: BLE001
         print(f"Error processing document: {e}")
         traceback.print_exc()
@@ -4,7 +4,10 @@ import asyncio
 import json
 import os
 import sys
+import typing
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import TypeVar
 
 import anchorite
 import dotenv
@@ -13,6 +16,28 @@ sys.path.insert(0, str(Path.cwd() / "src"))
 
 from gemini_ocr import DocAIAnchorProvider, GeminiMarkdownProvider
 
+T = TypeVar("T")
+
+
+async def _bounded_gather(coros: list[Coroutine[None, None, T]], limit: int) -> list[T]:
+    """Await coroutines concurrently, at most ``limit`` in flight at a time.
+
+    Runs under a TaskGroup, so the first failure cancels all remaining work
+    instead of letting queued API calls keep spending quota.
+    """
+    sem = asyncio.Semaphore(limit)
+    results: list[T | None] = [None] * len(coros)
+
+    async def _run(i: int, coro: Coroutine[None, None, T]) -> None:
+        async with sem:
+            results[i] = await coro
+
+    async with asyncio.TaskGroup() as tg:
+        for i, coro in enumerate(coros):
+            tg.create_task(_run(i, coro))
+
+    return typing.cast("list[T]", results)
+
 
 async def capture() -> None:
     dotenv.load_dotenv()
@@ -49,27 +74,32 @@ async def capture() -> None:
     )
 
     pdf_path = Path("tests/data/hubble-1929.pdf")
-    chunks = list(anchorite.document.chunks(pdf_path))
-
-    print(f"Processing {pdf_path} ({len(chunks)} chunks)...")
-
-    gemini_responses = []
-    for i, chunk in enumerate(chunks):
-        print(f"Generating Gemini markdown for chunk {i}...")
-        text = await markdown_provider.generate_markdown(chunk)
-        gemini_responses.append(text)
+    num_jobs = int(os.getenv("GEMINI_OCR_NUM_JOBS", "4"))
+
+    # Consume the chunk iterator once, pairing up both pipelines' coroutines
+    # per chunk; each chunk's bytes are then referenced only by its two tasks.
+    gem_coros = []
+    bbox_coros = []
+    for chunk in anchorite.document.chunks(pdf_path):
+        gem_coros.append(markdown_provider.generate_markdown(chunk))
+        bbox_coros.append(anchor_provider.generate_anchors(chunk))
+
+    print(f"Processing {pdf_path} ({len(gem_coros)} chunks, {num_jobs} concurrent)...")
+
+    # The two pipelines share no data, so let the slower API's latency hide
+    # the other's instead of serializing them.
+    gemini_responses, all_chunks_anchors = await asyncio.gather(
+        _bounded_gather(gem_coros, num_jobs),
+        _bounded_gather(bbox_coros, num_jobs),
+    )
 
     with open("tests/fixtures/hubble_gemini_responses.json", "w") as f:
         json.dump(gemini_responses, f)
     print("Saved Gemini responses.")
-
-    all_chunks_bboxes = []
-    for i, chunk in enumerate(chunks):
-        print(f"Generating DocAI bboxes for chunk {i}...")
-        anchors = await anchor_provider.generate_anchors(chunk)
-        all_chunks_bboxes.append(
-            [{"text": a.text, "page": a.page, "boxes": [b._asdict() for b in a.boxes]} for a in anchors],
-        )
+    all_chunks_bboxes = [
+        [{"text": a.text, "page": a.page, "boxes": [b._asdict() for b in a.boxes]} for a in anchors]
+        for anchors in all_chunks_anchors
+    ]
 
     with open("tests/fixtures/hubble_docai_bboxes.json", "w") as f:
         json.dump(all_chunks_bboxes, f)
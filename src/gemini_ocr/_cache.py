@@ -0,0 +1,28 @@
+"""Atomic write helpers shared by the provider disk caches."""
+
+import contextlib
+import os
+import pathlib
+import tempfile
+
+
+def write_atomic_bytes(path: pathlib.Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file + rename.
+
+    Concurrent chunk tasks (or processes sharing a cache dir) may race on the
+    same cache entry; the rename makes sure a reader never observes a
+    partially written file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+
+
+def write_atomic_text(path: pathlib.Path, text: str) -> None:
+    """Write ``text`` to ``path`` atomically; see ``write_atomic_bytes``."""
+    write_atomic_bytes(path, text.encode())
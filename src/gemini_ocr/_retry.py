@@ -0,0 +1,57 @@
+"""Retry helper for transient Google API failures."""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from google.api_core import exceptions as api_exceptions
+from google.genai import errors as genai_errors
+
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 5
+_INITIAL_DELAY_SECONDS = 1.0
+_MAX_DELAY_SECONDS = 30.0
+
+_TRANSIENT_API_EXCEPTIONS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+)
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 503, 504})
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, _TRANSIENT_API_EXCEPTIONS):
+        return True
+    return isinstance(exc, genai_errors.APIError) and exc.code in _TRANSIENT_STATUS_CODES
+
+
+async def transient_retry(fn: Callable[[], Awaitable[T]]) -> T:
+    """Await ``fn()``, retrying transient failures with exponential backoff.
+
+    Retries quota (429) and server (5xx) errors from the Gemini and Document AI
+    clients up to ``MAX_ATTEMPTS`` times, sleeping a jittered, exponentially
+    growing delay between attempts.  Anything else propagates immediately.
+    """
+    delay = _INITIAL_DELAY_SECONDS
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return await fn()
+        except (api_exceptions.GoogleAPICallError, genai_errors.APIError) as exc:
+            if attempt == MAX_ATTEMPTS or not _is_transient(exc):
+                raise
+            sleep_for = random.uniform(0, delay)  # noqa: S311 - jitter, not cryptography.
+            logging.warning(
+                "Transient API error (attempt %d/%d), retrying in %.1fs: %s",
+                attempt,
+                MAX_ATTEMPTS,
+                sleep_for,
+                exc,
+            )
+            await asyncio.sleep(sleep_for)
+            delay = min(delay * 2, _MAX_DELAY_SECONDS)
+    raise AssertionError("unreachable")
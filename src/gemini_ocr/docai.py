@@ -1,4 +1,4 @@
-import asyncio
+import functools
 import hashlib
 import logging
 import pathlib
@@ -8,6 +8,8 @@ import anchorite
 from google.api_core import client_options
 from google.cloud import documentai
 
+from gemini_ocr import _cache, _retry
+
 
 def _resolve_documentai_location(location: str, documentai_location: str | None) -> str:
     if documentai_location is not None:
@@ -15,7 +17,15 @@ def _resolve_documentai_location(location: str, documentai_location: str | None)
     return "eu" if location.startswith("eu") else "us"
 
 
-def _call_docai(  # noqa: PLR0913
+@functools.lru_cache(maxsize=8)
+def _get_client(resolved_location: str) -> documentai.DocumentProcessorServiceAsyncClient:
+    """Build (and cache) an async Document AI client for the given location."""
+    return documentai.DocumentProcessorServiceAsyncClient(
+        client_options=client_options.ClientOptions(api_endpoint=f"{resolved_location}-documentai.googleapis.com"),
+    )
+
+
+async def _call_docai(  # noqa: PLR0913
     project_id: str,
     location: str,
     documentai_location: str | None,
@@ -24,13 +34,11 @@ def _call_docai(  # noqa: PLR0913
     chunk: anchorite.document.DocumentChunk,
 ) -> documentai.Document:
     resolved_location = _resolve_documentai_location(location, documentai_location)
-    client = documentai.DocumentProcessorServiceClient(
-        client_options=client_options.ClientOptions(api_endpoint=f"{resolved_location}-documentai.googleapis.com"),
-    )
+    client = _get_client(resolved_location)
     name = client.processor_path(project_id, resolved_location, processor_id)
     raw_document = documentai.RawDocument(content=chunk.data, mime_type=chunk.mime_type)
     request = documentai.ProcessRequest(name=name, raw_document=raw_document, process_options=process_options)
-    return client.process_document(request=request).document
+    return (await client.process_document(request=request)).document
 
 
 def _generate_cache_path(
@@ -43,11 +51,11 @@ def _generate_cache_path(
     if not cache_dir or not cache:
         return None
     hasher = hashlib.sha256()
-    hasher.update(documentai.ProcessOptions.to_json(process_options, sort_keys=True).encode())
+    hasher.update(documentai.ProcessOptions.serialize(process_options))
     hasher.update(processor_id.encode())
     hasher.update(chunk.document_sha256.encode())
     cache_key = f"{hasher.hexdigest()}_{chunk.start_page}_{chunk.end_page}"
-    return pathlib.Path(cache_dir) / "docai" / f"{cache_key}.json"
+    return pathlib.Path(cache_dir) / "docai" / f"{cache_key}.binpb"
 
 
 async def process(  # noqa: PLR0913
@@ -65,21 +73,23 @@ async def process(  # noqa: PLR0913
 
     if cache_path and cache_path.exists():
         logging.debug("Loaded from DocAI cache: %s", cache_path)
-        return typing.cast("documentai.Document", documentai.Document.from_json(cache_path.read_text()))
-
-    doc = await asyncio.to_thread(
-        _call_docai,
-        project_id,
-        location,
-        documentai_location,
-        processor_id,
-        process_options,
-        chunk,
+        return typing.cast("documentai.Document", documentai.Document.deserialize(cache_path.read_bytes()))
+
+    doc = await _retry.transient_retry(
+        functools.partial(
+            _call_docai,
+            project_id,
+            location,
+            documentai_location,
+            processor_id,
+            process_options,
+            chunk,
+        ),
     )
 
     if cache_path:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(documentai.Document.to_json(doc))
+        _cache.write_atomic_bytes(cache_path, documentai.Document.serialize(doc))
         logging.debug("Saved to DocAI cache: %s", cache_path)
 
     return doc
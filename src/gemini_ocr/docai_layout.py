@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import dataclasses
 import re
 import textwrap
@@ -8,6 +10,11 @@ from google.cloud import documentai
 
 from gemini_ocr import docai
 
+# DocAI uses \(...\) / \[...\] math delimiters; compiled once so the per-block
+# fix-up in _process_text_block doesn't pay a regex-cache lookup per call.
+_INLINE_MATH_RE = re.compile(r"\\\(\s*(.*?)\s*\\\)")
+_DISPLAY_MATH_RE = re.compile(r"\\\[\s*(.*?)\s*\\\]")
+
 
 @dataclasses.dataclass
 class _TableCell:
@@ -40,10 +47,10 @@ class _LayoutProcessor:
     ) -> Generator[str, None, None]:
         text_type = block.text_block.type_
         text = block.text_block.text
-        # Fix math formatting: DocAI uses \(...\) for inline math, convert to $...$
-        # We also trim whitespace inside the delimiters to ensure correct rendering (e.g. $ = 32$ instead of $ = 32 $)
-        text = re.sub(r"\\\(\s*(.*?)\s*\\\)", r"$\1$", text)
-        text = re.sub(r"\\\[\s*(.*?)\s*\\\]", r"$$\1$$", text)
+        # Convert math to $...$ / $$...$$, trimming whitespace inside the
+        # delimiters to ensure correct rendering (e.g. $ = 32$ instead of $ = 32 $)
+        text = _INLINE_MATH_RE.sub(r"$\1$", text)
+        text = _DISPLAY_MATH_RE.sub(r"$$\1$$", text)
 
         if text_type.startswith("heading-"):
             level = int(text_type.split("-")[1])
@@ -188,6 +195,12 @@ class DocAIMarkdownProvider(anchorite.providers.MarkdownProvider):
     documentai_location: str | None = None
     cache_dir: str | None = None
     cache: bool = True
+    max_concurrency: int | None = None
+
+    def __post_init__(self) -> None:
+        # Bounds in-flight Document AI requests so a large document doesn't
+        # blow through the processor quota; None leaves concurrency to the caller.
+        self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
 
     async def generate_markdown(self, chunk: anchorite.document.DocumentChunk) -> str:
         process_options = documentai.ProcessOptions(
@@ -195,14 +208,15 @@ class DocAIMarkdownProvider(anchorite.providers.MarkdownProvider):
                 return_bounding_boxes=True,
             ),
         )
-        doc = await docai.process(
-            self.project_id,
-            self.location,
-            self.processor_id,
-            process_options,
-            chunk,
-            documentai_location=self.documentai_location,
-            cache_dir=self.cache_dir,
-            cache=self.cache,
-        )
+        async with self._semaphore or contextlib.nullcontext():
+            doc = await docai.process(
+                self.project_id,
+                self.location,
+                self.processor_id,
+                process_options,
+                chunk,
+                documentai_location=self.documentai_location,
+                cache_dir=self.cache_dir,
+                cache=self.cache,
+            )
         return "".join(_LayoutProcessor().process(doc.document_layout.blocks))
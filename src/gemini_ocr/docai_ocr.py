@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import dataclasses
 import logging
 
@@ -19,6 +21,12 @@ class DocAIAnchorProvider(anchorite.providers.AnchorProvider):
     documentai_location: str | None = None
     cache_dir: str | None = None
     cache: bool = True
+    max_concurrency: int | None = None
+
+    def __post_init__(self) -> None:
+        # Bounds in-flight Document AI requests so a large document doesn't
+        # blow through the processor quota; None leaves concurrency to the caller.
+        self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
 
     async def generate_anchors(self, chunk: anchorite.document.DocumentChunk) -> list[anchorite.Anchor]:
         process_options = documentai.ProcessOptions(
@@ -30,16 +38,17 @@ class DocAIAnchorProvider(anchorite.providers.AnchorProvider):
                 ),
             ),
         )
-        doc = await docai.process(
-            self.project_id,
-            self.location,
-            self.processor_id,
-            process_options,
-            chunk,
-            documentai_location=self.documentai_location,
-            cache_dir=self.cache_dir,
-            cache=self.cache,
-        )
+        async with self._semaphore or contextlib.nullcontext():
+            doc = await docai.process(
+                self.project_id,
+                self.location,
+                self.processor_id,
+                process_options,
+                chunk,
+                documentai_location=self.documentai_location,
+                cache_dir=self.cache_dir,
+                cache=self.cache,
+            )
 
         def _get_text(text_anchor: documentai.Document.TextAnchor) -> str:
             if not text_anchor.text_segments:
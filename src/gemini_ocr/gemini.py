@@ -1,5 +1,7 @@
 import asyncio
+import contextlib
 import dataclasses
+import functools
 import hashlib
 import logging
 import pathlib
@@ -9,6 +11,8 @@ import anchorite
 import google.auth
 from google import genai
 
+from gemini_ocr import _cache, _retry
+
 GEMINI_PROMPT: Final[str] = """
 Carefully transcribe the text for this pdf into a text file with
 markdown annotations.
@@ -53,6 +57,25 @@ when rendered.**
 """  # noqa: RUF001
 
 
+@functools.lru_cache(maxsize=8)
+def _get_client(project_id: str, location: str, quota_project_id: str | None) -> genai.Client:
+    """Build (and cache) a Gemini client for the given project/location.
+
+    Client construction resolves default credentials and sets up the transport,
+    which is expensive enough that repeating it for every chunk is pure overhead.
+    """
+    credentials, _ = google.auth.default()
+    if quota_project_id:
+        credentials = credentials.with_quota_project(quota_project_id)
+
+    return genai.Client(
+        vertexai=True,
+        project=project_id,
+        location=location,
+        credentials=credentials,
+    )
+
+
 @dataclasses.dataclass
 class GeminiMarkdownProvider(anchorite.providers.MarkdownProvider):
     """Markdown provider that generates markdown using the Gemini API."""
@@ -64,6 +87,12 @@ class GeminiMarkdownProvider(anchorite.providers.MarkdownProvider):
     prompt: str | None = None
     cache_dir: str | None = None
     cache: bool = True
+    max_concurrency: int | None = None
+
+    def __post_init__(self) -> None:
+        # Bounds in-flight Gemini requests so a large document doesn't blow
+        # through the per-minute quota; None leaves concurrency to the caller.
+        self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
 
     def _cache_path(self, chunk: anchorite.document.DocumentChunk) -> pathlib.Path | None:
         if not self.cache_dir or not self.cache:
@@ -77,19 +106,8 @@ class GeminiMarkdownProvider(anchorite.providers.MarkdownProvider):
         cache_key = f"{hasher.hexdigest()}_{chunk.start_page}_{chunk.end_page}"
         return pathlib.Path(self.cache_dir) / "gemini" / f"{cache_key}.txt"
 
-    def _call(self, chunk: anchorite.document.DocumentChunk) -> genai.types.GenerateContentResponse:
-        credentials, _ = google.auth.default()
-        if self.quota_project_id:
-            credentials = credentials.with_quota_project(self.quota_project_id)
-        elif self.project_id:
-            credentials = credentials.with_quota_project(self.project_id)
-
-        client = genai.Client(
-            vertexai=True,
-            project=self.project_id,
-            location=self.location,
-            credentials=credentials,
-        )
+    async def _call(self, chunk: anchorite.document.DocumentChunk) -> genai.types.GenerateContentResponse:
+        client = _get_client(self.project_id, self.location, self.quota_project_id or self.project_id)
 
         contents: list[genai.types.Part | str] = [
             genai.types.Part(inline_data=genai.types.Blob(data=chunk.data, mime_type=chunk.mime_type)),
@@ -98,7 +116,7 @@ class GeminiMarkdownProvider(anchorite.providers.MarkdownProvider):
         if self.prompt:
             contents.append(self.prompt)
 
-        return client.models.generate_content(
+        return await client.aio.models.generate_content(
             model=self.model_name,
             contents=contents,
             config=genai.types.GenerateContentConfig(response_mime_type="text/plain"),
@@ -111,12 +129,13 @@ class GeminiMarkdownProvider(anchorite.providers.MarkdownProvider):
             logging.debug("Loaded from Gemini cache: %s", cache_path)
             return cache_path.read_text()
 
-        response = await asyncio.to_thread(self._call, chunk)
+        async with self._semaphore or contextlib.nullcontext():
+            response = await _retry.transient_retry(functools.partial(self._call, chunk))
         text = response.text or ""
 
         if cache_path and text:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(text)
+            _cache.write_atomic_text(cache_path, text)
             logging.debug("Saved to Gemini cache: %s", cache_path)
 
         return text
@@ -34,6 +34,8 @@ def from_env(
     location = getdefault("location", "us-central1")
     documentai_location = get("documentai_location")
     cache_dir = get("cache_dir")
+    num_jobs = get("num_jobs")
+    max_concurrency = int(num_jobs) if num_jobs else None
     mode = _OcrMode(getdefault("mode", _OcrMode.GEMINI))
     include_bboxes = getdefault("include_bboxes", "true").lower() in ("true", "1", "yes")
 
@@ -46,6 +48,7 @@ def from_env(
                 quota_project_id=get("quota_project_id"),
                 prompt=get("gemini_prompt"),
                 cache_dir=cache_dir,
+                max_concurrency=max_concurrency,
             )
         case _OcrMode.DOCUMENTAI:
             markdown_provider = docai_layout.DocAIMarkdownProvider(
@@ -54,6 +57,7 @@ def from_env(
                 processor_id=require("layout_processor_id"),
                 documentai_location=documentai_location,
                 cache_dir=cache_dir,
+                max_concurrency=max_concurrency,
             )
         case _OcrMode.DOCLING:
             markdown_provider = docling.DoclingMarkdownProvider()
@@ -70,6 +74,7 @@ def from_env(
                 processor_id=ocr_processor_id,
                 documentai_location=documentai_location,
                 cache_dir=cache_dir,
+                max_concurrency=max_concurrency,
             )
 
     return markdown_provider, anchor_provider
@@ -0,0 +1,19 @@
+import pathlib
+
+from gemini_ocr import _cache
+
+
+def test_write_atomic_bytes(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "entry.binpb"
+    _cache.write_atomic_bytes(path, b"payload")
+
+    assert path.read_bytes() == b"payload"
+    assert list(tmp_path.iterdir()) == [path]  # no temp files left behind
+
+
+def test_write_atomic_text_overwrites(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "entry.txt"
+    path.write_text("stale")
+    _cache.write_atomic_text(path, "fresh")
+
+    assert path.read_text() == "fresh"
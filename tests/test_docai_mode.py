@@ -1,15 +1,15 @@
 import pathlib
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import anchorite
 import pytest
 from google.cloud import documentai
 
-from gemini_ocr import docai_layout, docai_ocr
+from gemini_ocr import docai, docai_layout, docai_ocr
 
 
 @patch("anchorite.document.pdfium.PdfDocument")
-@patch("gemini_ocr.docai.documentai.DocumentProcessorServiceClient")
+@patch("gemini_ocr.docai.documentai.DocumentProcessorServiceAsyncClient")
 @pytest.mark.asyncio
 async def test_process_document_docai_mode(
     mock_client_class: MagicMock,
@@ -19,6 +19,7 @@ async def test_process_document_docai_mode(
     dummy_pdf_path = tmp_path / "dummy.pdf"
     dummy_pdf_path.write_bytes(b"%PDF-1.5\n%dummy")
 
+    docai._get_client.cache_clear()
     mock_client = mock_client_class.return_value
     mock_client.processor_path.return_value = "projects/p/locations/l/processors/p"
 
@@ -54,7 +55,7 @@ async def test_process_document_docai_mode(
 
     mock_process_response = MagicMock()
     mock_process_response.document = mock_document
-    mock_client.process_document.return_value = mock_process_response
+    mock_client.process_document = AsyncMock(return_value=mock_process_response)
 
     mock_doc = MagicMock()
     mock_doc.__len__.return_value = 1
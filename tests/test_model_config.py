@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import anchorite
 import pytest
@@ -22,13 +22,15 @@ async def test_generate_markdown_uses_configured_model() -> None:
         mime_type="application/pdf",
     )
 
+    gemini_module._get_client.cache_clear()
     with patch("google.genai.Client") as mock_client:
         mock_response = MagicMock()
         mock_response.text = "Markdown content"
-        mock_client.return_value.models.generate_content.return_value = mock_response
+        mock_generate = AsyncMock(return_value=mock_response)
+        mock_client.return_value.aio.models.generate_content = mock_generate
 
         result = await provider.generate_markdown(chunk)
 
         assert result == "Markdown content"
-        _args, kwargs = mock_client.return_value.models.generate_content.call_args
+        _args, kwargs = mock_generate.call_args
         assert kwargs["model"] == "gemini-1.5-pro-preview-0409"
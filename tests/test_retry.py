@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.api_core import exceptions as api_exceptions
+
+from gemini_ocr import _retry
+
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried() -> None:
+    fn = AsyncMock(side_effect=[api_exceptions.ServiceUnavailable("flaky"), "ok"])
+
+    with patch.object(_retry.asyncio, "sleep", new=AsyncMock()) as mock_sleep:
+        result = await _retry.transient_retry(fn)
+
+    assert result == "ok"
+    assert fn.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_non_transient_error_raises_immediately() -> None:
+    fn = AsyncMock(side_effect=api_exceptions.PermissionDenied("nope"))
+
+    with pytest.raises(api_exceptions.PermissionDenied):
+        await _retry.transient_retry(fn)
+
+    assert fn.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_error_gives_up_after_max_attempts() -> None:
+    fn = AsyncMock(side_effect=api_exceptions.ResourceExhausted("quota"))
+
+    with (
+        patch.object(_retry.asyncio, "sleep", new=AsyncMock()),
+        pytest.raises(api_exceptions.ResourceExhausted),
+    ):
+        await _retry.transient_retry(fn)
+
+    assert fn.call_count == _retry.MAX_ATTEMPTS
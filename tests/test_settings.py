@@ -54,6 +54,36 @@ def test_from_env_no_bboxes() -> None:
     assert anchor_provider is None
 
 
+def test_from_env_num_jobs() -> None:
+    env = {
+        "GEMINI_OCR_PROJECT_ID": "p",
+        "GEMINI_OCR_GEMINI_MODEL_NAME": "gemini-2.0-flash",
+        "GEMINI_OCR_OCR_PROCESSOR_ID": "ocr-proc",
+        "GEMINI_OCR_NUM_JOBS": "3",
+    }
+    with patch.dict(os.environ, env, clear=True):
+        markdown_provider, anchor_provider = gemini_ocr.from_env()
+
+    assert isinstance(markdown_provider, gemini_module.GeminiMarkdownProvider)
+    assert markdown_provider.max_concurrency == 3
+    assert isinstance(anchor_provider, docai_ocr.DocAIAnchorProvider)
+    assert anchor_provider.max_concurrency == 3
+
+
+def test_from_env_num_jobs_documentai_mode() -> None:
+    env = {
+        "GEMINI_OCR_PROJECT_ID": "p",
+        "GEMINI_OCR_MODE": "documentai",
+        "GEMINI_OCR_LAYOUT_PROCESSOR_ID": "layout-proc",
+        "GEMINI_OCR_NUM_JOBS": "2",
+    }
+    with patch.dict(os.environ, env, clear=True):
+        markdown_provider, _ = gemini_ocr.from_env()
+
+    assert isinstance(markdown_provider, docai_layout.DocAIMarkdownProvider)
+    assert markdown_provider.max_concurrency == 2
+
+
 def test_from_env_missing_project_id() -> None:
     with (
         patch.dict(os.environ, {}, clear=True),